@@ -113,14 +113,20 @@ async function handleBatchAnalyze() {
             throw new Error('No model output files found (must end with _out.txt)');
         }
 
+        // Preprocess the shared ground truth once, not per model
+        const gtResult = preprocessText(groundTruth, config);
+
         // Process each model
         const results = [];
         for (const modelFile of modelFiles) {
+            // Yield to the event loop between models so the loading spinner
+            // keeps animating and the page stays responsive on large batches
+            await new Promise(resolve => setTimeout(resolve, 0));
+
             const modelName = modelFile.replace('_out.txt', '');
             const ocrOutput = fileContents[modelFile];
 
             // Process text
-            const gtResult = preprocessText(groundTruth, config);
             const ocrResult = preprocessText(ocrOutput, config);
 
             // Match words (exact matching only)
@@ -152,22 +158,22 @@ async function handleBatchAnalyze() {
 }
 
 async function readAllFiles(files) {
-    const fileContents = {};
+    // Read all files concurrently instead of awaiting them one at a time
+    const texts = await Promise.all(files.map(readFileAsText));
 
-    for (const file of files) {
-        const text = await readFileAsText(file);
-        fileContents[file.name] = text;
-    }
+    const fileContents = {};
+    files.forEach((file, i) => {
+        fileContents[file.name] = texts[i];
+    });
 
     return fileContents;
 }
 
 function readFileAsText(file) {
-    return new Promise((resolve, reject) => {
-        const reader = new FileReader();
-        reader.onload = (e) => resolve(e.target.result);
-        reader.onerror = (e) => reject(new Error('Failed to read file: ' + file.name));
-        reader.readAsText(file);
+    // File.text() reads and UTF-8-decodes natively, without the FileReader
+    // event plumbing or an intermediate result copy per file
+    return file.text().catch(() => {
+        throw new Error('Failed to read file: ' + file.name);
     });
 }
 
@@ -29,6 +29,12 @@ function toggleVisualization() {
     }
 }
 
+// Analysis results are deterministic in (ground truth, OCR output, config),
+// and users frequently re-run the same inputs while exploring the UI, so
+// cache complete results and make those re-runs free
+const ANALYZE_CACHE_MAX = 32;
+const analyzeCache = new Map();
+
 async function handleAnalyze() {
     const groundTruth = document.getElementById('ground-truth').value;
     const ocrOutput = document.getElementById('ocr-output').value;
@@ -47,26 +53,39 @@ async function handleAnalyze() {
     Utils.hideError();
 
     try {
-        // Process text using client-side backend
-        const gtResult = preprocessText(groundTruth, config);
-        const ocrResult = preprocessText(ocrOutput, config);
-
-        // Match words (exact matching only)
-        const matches = matchWords(gtResult.words, ocrResult.words);
-
-        // Calculate metrics (pass word arrays for accurate Levenshtein-based CER)
-        const metrics = calculateMetrics(matches, gtResult.words, ocrResult.words);
-
-        // Create annotations
-        const gtAnnotations = createAnnotations(gtResult.wordData, matches, true);
-        const ocrAnnotations = createAnnotations(ocrResult.wordData, matches, false);
+        const resultKey = JSON.stringify([configCacheKey(config), groundTruth, ocrOutput]);
+        let result = analyzeCache.get(resultKey);
+
+        if (!result) {
+            // Process text using client-side backend
+            const gtResult = preprocessText(groundTruth, config);
+            const ocrResult = preprocessText(ocrOutput, config);
+
+            // Match words (exact matching only)
+            const matches = matchWords(gtResult.words, ocrResult.words);
+
+            // Calculate metrics (pass word arrays for accurate Levenshtein-based CER)
+            const metrics = calculateMetrics(matches, gtResult.words, ocrResult.words);
+
+            // Create annotations
+            const gtAnnotations = createAnnotations(gtResult.wordData, matches, true);
+            const ocrAnnotations = createAnnotations(ocrResult.wordData, matches, false);
+
+            result = {
+                metrics: metrics,
+                gt_annotations: gtAnnotations,
+                ocr_annotations: ocrAnnotations
+            };
+
+            // Bound the cache, evicting the oldest entry first
+            if (analyzeCache.size >= ANALYZE_CACHE_MAX) {
+                analyzeCache.delete(analyzeCache.keys().next().value);
+            }
+            analyzeCache.set(resultKey, result);
+        }
 
         // Display results
-        displayManualResults({
-            metrics: metrics,
-            gt_annotations: gtAnnotations,
-            ocr_annotations: ocrAnnotations
-        });
+        displayManualResults(result);
 
     } catch (error) {
         Utils.showError(`Error: ${error.message}`);
@@ -114,6 +133,10 @@ function displayVisualization(containerId, annotations) {
     const container = document.getElementById(containerId);
     container.innerHTML = '';
 
+    // Build the spans in a fragment so the live DOM is touched once,
+    // not once per word
+    const fragment = document.createDocumentFragment();
+
     annotations.forEach(annotation => {
         const span = document.createElement('span');
         span.textContent = annotation.word + ' ';
@@ -132,6 +155,8 @@ function displayVisualization(containerId, annotations) {
         span.dataset.matchType = annotation.match_type;
         span.dataset.panel = containerId.includes('gt') ? 'gt' : 'ocr';
 
-        container.appendChild(span);
+        fragment.appendChild(span);
     });
+
+    container.appendChild(fragment);
 }
@@ -3,16 +3,29 @@
  * Implements two-phase matching: exact matching followed by fuzzy matching.
  */
 
+// Match type tags used in match tuples and annotations. Kept as strings
+// because the [gtWord, ocrWord, editDistance, matchType] tuple format is
+// part of the public contract (and what the tests assert against), but
+// centralized here so the literals aren't scattered across modules.
+const MATCH_EXACT = 'exact';
+const MATCH_GT_ONLY = 'gt_only';
+const MATCH_OCR_ONLY = 'ocr_only';
+
 /**
  * Count occurrences of items in an array (like Python's Counter).
  *
+ * Uses a Map rather than a plain object: string-keyed Maps are faster for
+ * this grow-and-bump access pattern, and they sidestep prototype
+ * collisions — a token like "constructor" would hit Object.prototype on a
+ * plain object and corrupt its count.
+ *
  * @param {Array} arr - Array of items
- * @returns {Object} Object with items as keys and counts as values
+ * @returns {Map} Map from item to occurrence count
  */
 function counter(arr) {
-    const counts = {};
+    const counts = new Map();
     for (const item of arr) {
-        counts[item] = (counts[item] || 0) + 1;
+        counts.set(item, (counts.get(item) || 0) + 1);
     }
     return counts;
 }
@@ -30,57 +43,55 @@ function counter(arr) {
  * @returns {Array} List of match tuples [gtWord, ocrWord, editDistance, matchType]
  */
 function matchWords(gtWords, ocrWords) {
+    // Degenerate inputs (e.g. OCR produced nothing) skip the counting
+    // phase: every word on the non-empty side is unmatched by definition
+    if (gtWords.length === 0) {
+        return ocrWords.map(word => [null, word, null, MATCH_OCR_ONLY]);
+    }
+    if (ocrWords.length === 0) {
+        return gtWords.map(word => [word, null, null, MATCH_GT_ONLY]);
+    }
+
     const matches = [];
 
     // Count word occurrences (handles duplicates)
     const gtCounts = counter(gtWords);
     const ocrCounts = counter(ocrWords);
 
-    // Track matched word instances
-    const gtMatched = {};
-    const ocrMatched = {};
-
-    // PHASE 1: Exact matching (greedy, highest counts first)
-    const gtWordsUnique = Object.keys(gtCounts).sort((a, b) => gtCounts[b] - gtCounts[a]);
-
-    for (const gtWord of gtWordsUnique) {
-        if (gtWord in ocrCounts) {
+    // PHASE 1: Exact matching
+    // Iteration order is irrelevant here — each word contributes
+    // min(gtCount, ocrCount) matches regardless — so skip the old
+    // sort-by-frequency pass over the unique words
+    for (const [gtWord, gtCount] of gtCounts) {
+        const ocrCount = ocrCounts.get(gtWord);
+        if (ocrCount !== undefined) {
             // Match as many instances as possible
-            const matchCount = Math.min(gtCounts[gtWord], ocrCounts[gtWord]);
+            const matchCount = Math.min(gtCount, ocrCount);
             for (let i = 0; i < matchCount; i++) {
-                matches.push([gtWord, gtWord, 0, 'exact']);
+                matches.push([gtWord, gtWord, 0, MATCH_EXACT]);
             }
-            gtMatched[gtWord] = matchCount;
-            ocrMatched[gtWord] = matchCount;
         }
     }
 
     // PHASE 2: Mark unmatched words
-    // Create lists of remaining unmatched instances
-    const gtRemaining = [];
-    for (const [word, count] of Object.entries(gtCounts)) {
-        const matched = gtMatched[word] || 0;
-        for (let i = 0; i < count - matched; i++) {
-            gtRemaining.push(word);
-        }
-    }
-
-    const ocrRemaining = [];
-    for (const [word, count] of Object.entries(ocrCounts)) {
-        const matched = ocrMatched[word] || 0;
-        for (let i = 0; i < count - matched; i++) {
-            ocrRemaining.push(word);
-        }
-    }
+    // Phase 1 consumes min(gtCount, ocrCount) instances of each word, so the
+    // leftover counts follow directly from the two counters — no need to track
+    // matched instances separately or build intermediate remaining-word lists.
 
     // GT words with no match (false negatives)
-    for (const gtWord of gtRemaining) {
-        matches.push([gtWord, null, null, 'gt_only']);
+    for (const [word, count] of gtCounts) {
+        const remaining = count - Math.min(count, ocrCounts.get(word) || 0);
+        for (let i = 0; i < remaining; i++) {
+            matches.push([word, null, null, MATCH_GT_ONLY]);
+        }
     }
 
     // OCR words with no match (false positives)
-    for (const ocrWord of ocrRemaining) {
-        matches.push([null, ocrWord, null, 'ocr_only']);
+    for (const [word, count] of ocrCounts) {
+        const remaining = count - Math.min(count, gtCounts.get(word) || 0);
+        for (let i = 0; i < remaining; i++) {
+            matches.push([null, word, null, MATCH_OCR_ONLY]);
+        }
     }
 
     return matches;
@@ -95,44 +106,33 @@ function matchWords(gtWords, ocrWords) {
  * @returns {Array} List of annotation objects
  */
 function createAnnotations(wordData, matches, isGroundTruth = true) {
-    // Build a mapping from normalized words to their match information
-    // Handle duplicates by tracking available matches
-    const matchMap = {}; // normalized_word -> list of {matchInfo, used: bool}
-
-    if (isGroundTruth) {
-        for (let idx = 0; idx < matches.length; idx++) {
-            const [gtWord, ocrWord, editDist, matchType] = matches[idx];
-            if (['exact', 'gt_only'].includes(matchType)) {
-                if (!(gtWord in matchMap)) {
-                    matchMap[gtWord] = [];
-                }
-                matchMap[gtWord].push({
-                    matched_with: ocrWord,
-                    edit_distance: editDist,
-                    match_type: matchType,
-                    match_id: matchType === 'exact' ? `match_${idx}` : null,
-                    order: idx,  // Track original order for first-to-first matching
-                    used: false  // Track if this match has been consumed
-                });
-            }
+    // Build a mapping from normalized words to their match information.
+    // Matches are scanned once in order, so each word's queues are already
+    // sorted for first-to-first consumption; a cursor per queue replaces
+    // the filter-and-sort scan that used to run for every word.
+    const ownOnlyType = isGroundTruth ? MATCH_GT_ONLY : MATCH_OCR_ONLY;
+    const matchMap = new Map(); // normalized word -> {exact, only, exactNext, onlyNext}
+
+    for (let idx = 0; idx < matches.length; idx++) {
+        const [gtWord, ocrWord, editDist, matchType] = matches[idx];
+        if (matchType !== MATCH_EXACT && matchType !== ownOnlyType) {
+            continue;
         }
-    } else {
-        for (let idx = 0; idx < matches.length; idx++) {
-            const [gtWord, ocrWord, editDist, matchType] = matches[idx];
-            if (['exact', 'ocr_only'].includes(matchType)) {
-                if (!(ocrWord in matchMap)) {
-                    matchMap[ocrWord] = [];
-                }
-                matchMap[ocrWord].push({
-                    matched_with: gtWord,
-                    edit_distance: editDist,
-                    match_type: matchType,
-                    match_id: matchType === 'exact' ? `match_${idx}` : null,
-                    order: idx,  // Track original order for first-to-first matching
-                    used: false  // Track if this match has been consumed
-                });
-            }
+
+        const word = isGroundTruth ? gtWord : ocrWord;
+        let entry = matchMap.get(word);
+        if (!entry) {
+            entry = { exact: [], only: [], exactNext: 0, onlyNext: 0 };
+            matchMap.set(word, entry);
         }
+
+        const info = {
+            matched_with: isGroundTruth ? ocrWord : gtWord,
+            edit_distance: editDist,
+            match_type: matchType,
+            match_id: matchType === MATCH_EXACT ? `match_${idx}` : null
+        };
+        (matchType === MATCH_EXACT ? entry.exact : entry.only).push(info);
     }
 
     // Create annotations in original word order
@@ -142,37 +142,19 @@ function createAnnotations(wordData, matches, isGroundTruth = true) {
         const normalized = wordInfo.normalized;
         const original = wordInfo.original;
 
-        if (normalized in matchMap) {
-            // Find the next available (unused) match for this word
-            // Prefer exact matches, then only matches, with first-to-first ordering
-            const availableMatches = matchMap[normalized].filter(m => !m.used);
-
-            let matchInfo;
-            if (availableMatches.length > 0) {
-                // Prioritize exact matches over only matches (first-to-first ordering)
-                // First, try to find an exact match (prefer lower order for first-to-first)
-                const exactMatches = availableMatches
-                    .filter(m => m.match_type === 'exact')
-                    .sort((a, b) => a.order - b.order);
-
-                if (exactMatches.length > 0) {
-                    matchInfo = exactMatches[0];
-                } else {
-                    // No exact match available, use first only match (sorted by order)
-                    const onlyMatches = availableMatches.sort((a, b) => a.order - b.order);
-                    matchInfo = onlyMatches[0];
-                }
-                matchInfo.used = true; // Mark as consumed
-            } else {
-                // All matches for this word have been used - mark as unmatched
-                matchInfo = {
-                    match_type: isGroundTruth ? 'gt_only' : 'ocr_only',
-                    matched_with: null,
-                    edit_distance: null,
-                    match_id: null
-                };
+        // Consume the next available match for this word, prioritizing exact
+        // matches over only matches (first-to-first ordering)
+        const entry = matchMap.get(normalized);
+        let matchInfo = null;
+        if (entry) {
+            if (entry.exactNext < entry.exact.length) {
+                matchInfo = entry.exact[entry.exactNext++];
+            } else if (entry.onlyNext < entry.only.length) {
+                matchInfo = entry.only[entry.onlyNext++];
             }
+        }
 
+        if (matchInfo) {
             annotations.push({
                 word: original,  // Use original word, not normalized
                 match_type: matchInfo.match_type,
@@ -181,10 +163,10 @@ function createAnnotations(wordData, matches, isGroundTruth = true) {
                 match_id: matchInfo.match_id
             });
         } else {
-            // No match found - shouldn't happen but handle gracefully
+            // No match left for this word - mark as unmatched
             annotations.push({
                 word: original,
-                match_type: isGroundTruth ? 'gt_only' : 'ocr_only',
+                match_type: ownOnlyType,
                 matched_with: null,
                 edit_distance: null,
                 match_id: null
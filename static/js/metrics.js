@@ -5,52 +5,278 @@
 
 /**
  * Calculate Levenshtein (edit) distance between two strings.
- * Uses dynamic programming approach.
+ *
+ * Both paths are bit-parallel (Myers 1999): patterns of up to 32 chars fit
+ * one machine word and run the single-block kernel with scalar bitvectors;
+ * longer patterns (the document-level CER path) use the multi-block
+ * formulation. Either way, one bitwise update advances 32 DP cells.
  *
  * @param {string} str1 - First string
  * @param {string} str2 - Second string
  * @returns {number} Minimum number of single-character edits (insertions, deletions, substitutions)
  */
 function levenshteinDistance(str1, str2) {
-    const m = str1.length;
-    const n = str2.length;
+    // Distance is symmetric; make str1 the shorter string so it drives the
+    // pattern bitmasks
+    if (str1.length > str2.length) {
+        [str1, str2] = [str2, str1];
+    }
+
+    // Identical strings (the common case for exact-match heavy comparisons)
+    // need no DP at all
+    if (str1 === str2) return 0;
+
+    // Strip the common prefix and suffix: edit distance is invariant under
+    // shared affixes, and near-identical OCR text is mostly affix, so this
+    // often shrinks the strings the kernels actually see by orders of
+    // magnitude
+    let start = 0;
+    let end1 = str1.length;
+    let end2 = str2.length;
+    while (start < end1 && str1.charCodeAt(start) === str2.charCodeAt(start)) {
+        start++;
+    }
+    while (end1 > start && str1.charCodeAt(end1 - 1) === str2.charCodeAt(end2 - 1)) {
+        end1--;
+        end2--;
+    }
+    if (start > 0 || end1 < str1.length) {
+        str1 = str1.slice(start, end1);
+        str2 = str2.slice(start, end2);
+    }
 
     // Handle edge cases
+    if (str1.length === 0) return str2.length;
+
+    // After affix stripping, a single differing code unit on each side is
+    // exactly one substitution — the most common OCR error class (Hamming
+    // distance 1) resolves here without touching a kernel
+    if (str1.length === 1 && str2.length === 1) return 1;
+
+    if (str1.length <= 32) {
+        return myersDistance32(str1, str2);
+    }
+    return myersDistance(str1, str2);
+}
+
+/**
+ * Single-block Myers bit-parallel Levenshtein for patterns of <= 32 chars.
+ *
+ * Covers typical word-length inputs: the whole DP column fits in one 32-bit
+ * word, so VP/VN are plain numbers and each text character costs a fixed
+ * handful of bitwise operations — no row arrays, no cell-at-a-time DP.
+ *
+ * @param {string} pattern - Shorter string, at most 32 chars
+ * @param {string} text - Longer string
+ * @returns {number} Levenshtein distance between pattern and text
+ */
+function myersDistance32(pattern, text) {
+    const m = pattern.length;
+    const n = text.length;
+    const lastBit = m - 1;
+
+    // Peq: bit i of peq[code] set iff pattern[i] has that char code; flat
+    // array for ASCII, Map fallback for anything else (as in myersDistance)
+    const peqAscii = new Array(128).fill(0);
+    let peqOther = null;
+    for (let i = 0; i < m; i++) {
+        const code = pattern.charCodeAt(i);
+        if (code < 128) {
+            peqAscii[code] |= 1 << i;
+        } else {
+            if (peqOther === null) {
+                peqOther = new Map();
+            }
+            peqOther.set(code, (peqOther.get(code) | 0) | (1 << i));
+        }
+    }
+
+    // All m pattern bits start as "increases down the column"
+    let VP = 0xFFFFFFFF >>> (32 - m);
+    let VN = 0;
+    let score = m;
+
+    for (let j = 0; j < n; j++) {
+        const code = text.charCodeAt(j);
+        const eq = code < 128
+            ? peqAscii[code]
+            : (peqOther !== null ? peqOther.get(code) | 0 : 0);
+
+        const x = eq | VN;
+        // The + carries match runs; ^ and | recover the diagonal-zero bits.
+        // >>> 0 keeps the 32-bit sum unsigned before the int32 xor
+        const d0 = ((((x & VP) >>> 0) + VP) ^ VP) | x;
+        const hp = VN | ~(d0 | VP);
+        const hn = VP & d0;
+
+        score += (hp >>> lastBit) & 1;
+        score -= (hn >>> lastBit) & 1;
+
+        const hpShifted = (hp << 1) | 1;  // the 1 models the increasing first row
+        const hnShifted = hn << 1;
+        VP = (hnShifted | ~(d0 | hpShifted)) >>> 0;
+        VN = (hpShifted & d0) >>> 0;
+    }
+
+    return score;
+}
+
+/**
+ * Myers' bit-parallel Levenshtein distance (Hyyrö's block formulation).
+ *
+ * Encodes a whole DP column as bitvectors (VP/VN: positions where the cell
+ * value increases/decreases down the column) and advances one text character
+ * per iteration with a constant number of bitwise operations per 32-bit
+ * block. JavaScript bitwise operators work on 32 bits, so patterns longer
+ * than 32 chars are split across a Uint32Array of blocks with the addition
+ * and shift carries propagated manually.
+ *
+ * @param {string} pattern - Shorter string (its length drives the bitmasks)
+ * @param {string} text - Longer string (iterated one character at a time)
+ * @returns {number} Levenshtein distance between pattern and text
+ */
+function myersDistance(pattern, text) {
+    const m = pattern.length;
+    const n = text.length;
+    const blocks = (m + 31) >> 5;
+    const lastBlock = blocks - 1;
+    const lastBit = (m - 1) & 31;
+
+    // Peq: char code -> bitmasks with bit j set iff pattern[j] is that char.
+    // OCR text is overwhelmingly ASCII, so codes below 128 live in a flat
+    // array indexed by code (plain bounds-checked load in the hot loop);
+    // anything else falls back to a Map
+    const peqAscii = new Array(128);
+    const peqOther = new Map();
+    for (let i = 0; i < m; i++) {
+        const code = pattern.charCodeAt(i);
+        let masks;
+        if (code < 128) {
+            masks = peqAscii[code];
+            if (masks === undefined) {
+                masks = peqAscii[code] = new Uint32Array(blocks);
+            }
+        } else {
+            masks = peqOther.get(code);
+            if (masks === undefined) {
+                masks = new Uint32Array(blocks);
+                peqOther.set(code, masks);
+            }
+        }
+        masks[i >> 5] |= 1 << (i & 31);
+    }
+
+    // VP/VN: vertical positive/negative delta bits; the score starts at m
+    // (first column of the DP matrix) and is adjusted by the bit that falls
+    // off the last row each step
+    const VP = new Uint32Array(blocks).fill(0xFFFFFFFF);
+    const VN = new Uint32Array(blocks);
+    let score = m;
+
+    for (let j = 0; j < n; j++) {
+        const code = text.charCodeAt(j);
+        const eq = code < 128 ? peqAscii[code] : peqOther.get(code);
+
+        let sumCarry = 0;  // carry of the block-local addition
+        let hpCarry = 1;   // HP shift-in; 1 models the increasing first row
+        let hnCarry = 0;   // HN shift-in
+
+        for (let b = 0; b < blocks; b++) {
+            const pe = eq !== undefined ? eq[b] : 0;
+            const vp = VP[b];
+            const vn = VN[b];
+
+            const x = pe | vn;
+            // (X & VP) + VP with the carry chained across blocks; JS numbers
+            // hold the 33-bit intermediate sum exactly
+            const sum = ((x & vp) >>> 0) + vp + sumCarry;
+            sumCarry = sum > 0xFFFFFFFF ? 1 : 0;
+            const d0 = ((sum ^ vp) | x) >>> 0;
+            const hp = (vn | ~(d0 | vp)) >>> 0;
+            const hn = vp & d0;
+
+            if (b === lastBlock) {
+                score += (hp >>> lastBit) & 1;
+                score -= (hn >>> lastBit) & 1;
+            }
+
+            // Shift HP/HN up one row, carrying the top bit into the next block
+            const hpShifted = ((hp << 1) | hpCarry) >>> 0;
+            const hnShifted = ((hn << 1) | hnCarry) >>> 0;
+            hpCarry = hp >>> 31;
+            hnCarry = (hn >>> 31) & 1;
+
+            VP[b] = hnShifted | ~(d0 | hpShifted);
+            VN[b] = hpShifted & d0;
+        }
+    }
+
+    return score;
+}
+
+/**
+ * Optimal String Alignment (OSA) distance.
+ *
+ * Levenshtein extended with adjacent transpositions: swapping two
+ * neighboring characters counts as one edit instead of two. This is often
+ * a closer model of real OCR confusions (e.g. "form" read as "from"), at
+ * the cost of one extra comparison per DP cell. Not used for CER — the
+ * reported metric stays standard Levenshtein-based — but available for
+ * callers that want transposition-aware distances.
+ *
+ * @param {string} str1 - First string
+ * @param {string} str2 - Second string
+ * @returns {number} Minimum number of insertions, deletions, substitutions, and adjacent transpositions
+ */
+function osaDistance(str1, str2) {
+    if (str1 === str2) return 0;
+
+    const m = str1.length;
+    const n = str2.length;
     if (m === 0) return n;
     if (n === 0) return m;
 
-    // Create 2D array for dynamic programming
-    // Use only two rows to save memory (current and previous)
-    let prevRow = new Array(n + 1);
-    let currRow = new Array(n + 1);
+    // Precompute code units for integer compares, as in the Levenshtein DP
+    const codes1 = new Uint16Array(m);
+    for (let i = 0; i < m; i++) {
+        codes1[i] = str1.charCodeAt(i);
+    }
+    const codes2 = new Uint16Array(n);
+    for (let j = 0; j < n; j++) {
+        codes2[j] = str2.charCodeAt(j);
+    }
 
-    // Initialize first row (distance from empty string to str2 prefixes)
+    // The transposition case looks two rows back, so keep three rolling rows
+    let prevPrevRow = new Uint32Array(n + 1);
+    let prevRow = new Uint32Array(n + 1);
+    let currRow = new Uint32Array(n + 1);
     for (let j = 0; j <= n; j++) {
         prevRow[j] = j;
     }
 
-    // Fill the matrix
     for (let i = 1; i <= m; i++) {
-        currRow[0] = i; // Distance from str1 prefix to empty string
+        currRow[0] = i;
+        const code1 = codes1[i - 1];
 
         for (let j = 1; j <= n; j++) {
-            if (str1[i - 1] === str2[j - 1]) {
-                // Characters match, no operation needed
-                currRow[j] = prevRow[j - 1];
-            } else {
-                // Take minimum of:
-                // - prevRow[j] + 1: deletion from str1
-                // - currRow[j-1] + 1: insertion into str1
-                // - prevRow[j-1] + 1: substitution
-                currRow[j] = 1 + Math.min(prevRow[j], currRow[j - 1], prevRow[j - 1]);
+            const cost = code1 === codes2[j - 1] ? 0 : 1;
+            let best = prevRow[j - 1] + cost;  // substitution / match
+            const del = prevRow[j] + 1;
+            if (del < best) best = del;
+            const ins = currRow[j - 1] + 1;
+            if (ins < best) best = ins;
+            // Adjacent transposition: str1[i-2..i-1] crossed with str2[j-2..j-1]
+            if (i > 1 && j > 1 && code1 === codes2[j - 2] && codes1[i - 2] === codes2[j - 1]) {
+                const trans = prevPrevRow[j - 2] + 1;
+                if (trans < best) best = trans;
             }
+            currRow[j] = best;
         }
 
-        // Swap rows
-        [prevRow, currRow] = [currRow, prevRow];
+        [prevPrevRow, prevRow, currRow] = [prevRow, currRow, prevPrevRow];
     }
 
-    // Result is in prevRow because of the final swap
+    // Result is in prevRow because of the final rotation
     return prevRow[n];
 }
 
@@ -69,15 +295,25 @@ function levenshteinDistance(str1, str2) {
  * @returns {Object} Dictionary with metrics
  */
 function calculateMetrics(matches, gtWords, ocrWords) {
-    // Separate matches by type
-    const exactMatches = matches.filter(m => m[3] === 'exact');
-    const gtOnlyMatches = matches.filter(m => m[3] === 'gt_only');
-    const ocrOnlyMatches = matches.filter(m => m[3] === 'ocr_only');
+    // Tally match types in a single pass instead of filtering the match
+    // list once per type (which allocated three throwaway arrays)
+    let exactCount = 0;
+    let gtOnlyCount = 0;
+    let ocrOnlyCount = 0;
+    for (const match of matches) {
+        const matchType = match[3];
+        if (matchType === MATCH_EXACT) {
+            exactCount++;
+        } else if (matchType === MATCH_GT_ONLY) {
+            gtOnlyCount++;
+        } else if (matchType === MATCH_OCR_ONLY) {
+            ocrOnlyCount++;
+        }
+    }
 
     // Count totals
-    const exactCount = exactMatches.length;
-    const totalGtWords = exactCount + gtOnlyMatches.length;
-    const totalOcrWords = exactCount + ocrOnlyMatches.length;
+    const totalGtWords = exactCount + gtOnlyCount;
+    const totalOcrWords = exactCount + ocrOnlyCount;
 
     // Calculate Precision and Recall (only exact matches count)
     const precision = totalOcrWords > 0 ? exactCount / totalOcrWords : 0.0;
@@ -103,7 +339,10 @@ function calculateMetrics(matches, gtWords, ocrWords) {
 
         if (totalGtChars > 0) {
             const cer = charErrors / totalGtChars;
-            avgCrr = 1.0 - cer;
+            // When the OCR text is much longer than the GT, the distance can
+            // exceed the GT length; floor the rate at 0 rather than reporting
+            // a negative recognition rate
+            avgCrr = Math.max(0.0, 1.0 - cer);
         }
     } else {
         // Fallback for tests that don't provide word arrays:
@@ -112,12 +351,12 @@ function calculateMetrics(matches, gtWords, ocrWords) {
         const ocrWordsFromMatches = [];
 
         for (const [gtWord, ocrWord, , matchType] of matches) {
-            if (matchType === 'exact') {
+            if (matchType === MATCH_EXACT) {
                 gtWordsFromMatches.push(gtWord);
                 ocrWordsFromMatches.push(ocrWord);
-            } else if (matchType === 'gt_only') {
+            } else if (matchType === MATCH_GT_ONLY) {
                 gtWordsFromMatches.push(gtWord);
-            } else if (matchType === 'ocr_only') {
+            } else if (matchType === MATCH_OCR_ONLY) {
                 ocrWordsFromMatches.push(ocrWord);
             }
         }
@@ -129,7 +368,10 @@ function calculateMetrics(matches, gtWords, ocrWords) {
 
         if (totalGtChars > 0) {
             const cer = charErrors / totalGtChars;
-            avgCrr = 1.0 - cer;
+            // When the OCR text is much longer than the GT, the distance can
+            // exceed the GT length; floor the rate at 0 rather than reporting
+            // a negative recognition rate
+            avgCrr = Math.max(0.0, 1.0 - cer);
         }
     }
 
@@ -141,14 +383,20 @@ function calculateMetrics(matches, gtWords, ocrWords) {
         exact_matches: exactCount,
         total_gt_words: totalGtWords,
         total_ocr_words: totalOcrWords,
-        unmatched_gt: gtOnlyMatches.length,
-        unmatched_ocr: ocrOnlyMatches.length,
+        unmatched_gt: gtOnlyCount,
+        unmatched_ocr: ocrOnlyCount,
         // Additional data for tooltips
         char_errors: charErrors,
         total_gt_chars: totalGtChars
     };
 }
 
+// Metric keys rendered as percentages; the remaining display keys are
+// plain counts and pass through unformatted
+const PERCENT_METRIC_KEYS = ['precision', 'recall', 'avg_crr', 'f1_score'];
+const COUNT_METRIC_KEYS = ['exact_matches', 'total_gt_words', 'total_ocr_words',
+                           'unmatched_gt', 'unmatched_ocr'];
+
 /**
  * Format metrics as percentages for display.
  *
@@ -156,17 +404,14 @@ function calculateMetrics(matches, gtWords, ocrWords) {
  * @returns {Object} Formatted metrics with percentage strings
  */
 function formatMetricsForDisplay(metrics) {
-    return {
-        precision: `${(metrics.precision * 100).toFixed(2)}%`,
-        recall: `${(metrics.recall * 100).toFixed(2)}%`,
-        avg_crr: `${(metrics.avg_crr * 100).toFixed(2)}%`,
-        f1_score: `${(metrics.f1_score * 100).toFixed(2)}%`,
-        exact_matches: metrics.exact_matches,
-        total_gt_words: metrics.total_gt_words,
-        total_ocr_words: metrics.total_ocr_words,
-        unmatched_gt: metrics.unmatched_gt,
-        unmatched_ocr: metrics.unmatched_ocr
-    };
+    const formatted = {};
+    for (const key of PERCENT_METRIC_KEYS) {
+        formatted[key] = `${(metrics[key] * 100).toFixed(2)}%`;
+    }
+    for (const key of COUNT_METRIC_KEYS) {
+        formatted[key] = metrics[key];
+    }
+    return formatted;
 }
 
 /**
@@ -3,6 +3,49 @@
  * Handles tokenization and normalization based on configuration.
  */
 
+// Default punctuation set (mirrors Python's string.punctuation)
+const DEFAULT_PUNCTUATION = '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~';
+
+/**
+ * Escape characters so they can be embedded in a regex character class.
+ *
+ * @param {string} chars - Raw characters
+ * @returns {string} Escaped characters
+ */
+function escapeForCharClass(chars) {
+    return chars.replace(/[-[\]{}()*+?.,\\^$|#\s]/g, '\\$&');
+}
+
+/**
+ * Get the split/strip regexes for a punctuation set.
+ *
+ * The default set is by far the common case, so its patterns are compiled
+ * once at load; custom sets are compiled on first use and cached.
+ *
+ * @param {string} punctChars - Punctuation characters to match
+ * @returns {Object} Object with {split, strip} RegExp properties
+ */
+const punctPatternCache = new Map();
+
+function punctuationPatterns(punctChars) {
+    let patterns = punctPatternCache.get(punctChars);
+    if (!patterns) {
+        const escaped = escapeForCharClass(punctChars);
+        patterns = {
+            split: new RegExp(`[${escaped}]+`),
+            strip: new RegExp(`[${escaped}]`, 'g')
+        };
+        punctPatternCache.set(punctChars, patterns);
+    }
+    return patterns;
+}
+
+// Compile the default set eagerly so the first analysis doesn't pay for it
+punctuationPatterns(DEFAULT_PUNCTUATION);
+
+// Matches runs of non-whitespace; hoisted so the pattern object is built once
+const TOKEN_PATTERN = /\S+/g;
+
 /**
  * Tokenize text into words by splitting on whitespace.
  *
@@ -14,8 +57,10 @@ function tokenize(text) {
         return [];
     }
 
-    // Split on whitespace (spaces, tabs, newlines)
-    return text.split(/\s+/).filter(word => word.length > 0);
+    // Extracting non-whitespace runs handles spaces, tabs, and newlines in
+    // one pass, without the empty leading token (and filter step) that
+    // splitting on whitespace produced
+    return text.match(TOKEN_PATTERN) || [];
 }
 
 /**
@@ -28,12 +73,10 @@ function tokenize(text) {
 function removePunctuation(word, punctuationChars) {
     // Default punctuation if not provided
     if (!punctuationChars) {
-        punctuationChars = '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~';
+        punctuationChars = DEFAULT_PUNCTUATION;
     }
 
-    // Create regex pattern from punctuation characters
-    const pattern = new RegExp(`[${punctuationChars.replace(/[-[\]{}()*+?.,\\^$|#\s]/g, '\\$&')}]`, 'g');
-    return word.replace(pattern, '');
+    return word.replace(punctuationPatterns(punctuationChars).strip, '');
 }
 
 /**
@@ -48,17 +91,25 @@ function normalize(words, config) {
         return [];
     }
 
+    // Resolve config options — and the compiled strip pattern behind
+    // removePunctuation — once instead of per word
+    const caseSensitive = config.case_sensitive === true;
+    let stripPattern = null;
+    if (config.ignore_punctuation !== false) {
+        const punctChars = config.punctuation_chars || DEFAULT_PUNCTUATION;
+        stripPattern = punctuationPatterns(punctChars).strip;
+    }
+
     const normalized = [];
 
     for (let word of words) {
         // Handle punctuation
-        if (config.ignore_punctuation !== false) {
-            const punctChars = config.punctuation_chars || '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~';
-            word = removePunctuation(word, punctChars);
+        if (stripPattern) {
+            word = word.replace(stripPattern, '');
         }
 
         // Handle case sensitivity
-        if (config.case_sensitive !== true) {
+        if (!caseSensitive) {
             word = word.toLowerCase();
         }
 
@@ -71,6 +122,64 @@ function normalize(words, config) {
     return normalized;
 }
 
+// Cache of complete preprocessText() results, keyed by input text and config.
+// Repeated "Analyze" clicks and batch runs re-send the same ground truth, so
+// a hit skips the whole tokenize/normalize pass. Results are treated as
+// read-only by callers, so sharing the cached object is safe.
+const PREPROCESS_CACHE_MAX = 64;
+const preprocessCache = new Map();
+
+/**
+ * Build a cache key capturing the config options that affect preprocessing.
+ *
+ * @param {Object} config - Configuration object
+ * @returns {string} Stable key for the relevant config values
+ */
+function configCacheKey(config) {
+    return `${config.case_sensitive === true}|${config.ignore_punctuation !== false}|${config.punctuation_chars || ''}`;
+}
+
+// Per-token normalization cache, keyed by token and config. OCR corpora have
+// Zipfian word distributions — a small set of tokens covers most occurrences —
+// so repeats skip the punctuation split and lowercasing entirely.
+const NORM_CACHE_MAX = 100000;
+const normCache = new Map();
+
+/**
+ * Normalize a single token into its (normalized, original) parts.
+ *
+ * @param {string} original - Original token from the text
+ * @param {RegExp|null} splitPattern - Punctuation split pattern, or null to keep punctuation
+ * @param {boolean} caseSensitive - Whether to preserve case
+ * @returns {Array} List of {normalized, original} part objects
+ */
+function normalizeWordParts(original, splitPattern, caseSensitive) {
+    let parts = [original];
+
+    // When ignoring punctuation, split on punctuation characters first
+    // This handles cases like "INV-2024-001" -> ["INV", "2024", "001"]
+    if (splitPattern) {
+        parts = original.split(splitPattern).filter(p => p.length > 0);
+    }
+
+    const results = [];
+    for (const part of parts) {
+        let normalized = part;
+
+        // Handle case sensitivity
+        if (!caseSensitive) {
+            normalized = normalized.toLowerCase();
+        }
+
+        // Only keep non-empty words
+        if (normalized) {
+            results.push({ normalized: normalized, original: part });
+        }
+    }
+
+    return results;
+}
+
 /**
  * Complete preprocessing pipeline: tokenize and normalize.
  *
@@ -79,8 +188,25 @@ function normalize(words, config) {
  * @returns {Object} Object with normalized words and word data
  */
 function preprocessText(text, config) {
+    const cfgKey = configCacheKey(config);
+    const cacheKey = `${cfgKey}\u0000${text}`;
+    const cached = preprocessCache.get(cacheKey);
+    if (cached) {
+        return cached;
+    }
+
     const originalWords = tokenize(text);
 
+    // Resolve config options and build the punctuation pattern once,
+    // rather than re-deriving them for every token
+    const ignorePunct = config.ignore_punctuation !== false;
+    const caseSensitive = config.case_sensitive === true;
+    let splitPattern = null;
+    if (ignorePunct) {
+        const punctChars = config.punctuation_chars || DEFAULT_PUNCTUATION;
+        splitPattern = punctuationPatterns(punctChars).split;
+    }
+
     // Normalize each word individually and track which ones remain
     // This preserves the correct pairing between original and normalized
     const normalizedWords = [];
@@ -88,39 +214,38 @@ function preprocessText(text, config) {
 
     for (let i = 0; i < originalWords.length; i++) {
         const original = originalWords[i];
-        let parts = [original];
-
-        // When ignoring punctuation, split on punctuation characters first
-        // This handles cases like "INV-2024-001" -> ["INV", "2024", "001"]
-        if (config.ignore_punctuation !== false) {
-            const punctChars = config.punctuation_chars || '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~';
-            const pattern = new RegExp(`[${punctChars.replace(/[-[\]{}()*+?.,\\^$|#\s]/g, '\\$&')}]+`);
-            parts = original.split(pattern).filter(p => p.length > 0);
-        }
-
-        // Process each part
-        for (const part of parts) {
-            let normalized = part;
 
-            // Handle case sensitivity
-            if (config.case_sensitive !== true) {
-                normalized = normalized.toLowerCase();
+        // Look up the token's normalized parts, computing them on first sight
+        const wordKey = `${cfgKey}\u0000${original}`;
+        let parts = normCache.get(wordKey);
+        if (parts === undefined) {
+            parts = normalizeWordParts(original, splitPattern, caseSensitive);
+            if (normCache.size >= NORM_CACHE_MAX) {
+                normCache.delete(normCache.keys().next().value);
             }
+            normCache.set(wordKey, parts);
+        }
 
-            // Only keep non-empty words
-            if (normalized) {
-                normalizedWords.push(normalized);
-                wordData.push({
-                    normalized: normalized,
-                    original: part,
-                    position: normalizedWords.length - 1  // Position in normalized list
-                });
-            }
+        for (const part of parts) {
+            normalizedWords.push(part.normalized);
+            wordData.push({
+                normalized: part.normalized,
+                original: part.original,
+                position: normalizedWords.length - 1  // Position in normalized list
+            });
         }
     }
 
-    return {
+    const result = {
         words: normalizedWords,
         wordData: wordData
     };
+
+    // Bound the cache; Map preserves insertion order, so the first key is the oldest
+    if (preprocessCache.size >= PREPROCESS_CACHE_MAX) {
+        preprocessCache.delete(preprocessCache.keys().next().value);
+    }
+    preprocessCache.set(cacheKey, result);
+
+    return result;
 }
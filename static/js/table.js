@@ -227,6 +227,10 @@ window.TableRenderer = {
     renderAnnotations(container, annotations, panel) {
         container.innerHTML = '';
 
+        // Build the spans in a fragment so the live DOM is touched once,
+        // not once per word
+        const fragment = document.createDocumentFragment();
+
         annotations.forEach(annotation => {
             const span = document.createElement('span');
             span.textContent = annotation.word + ' ';
@@ -244,8 +248,10 @@ window.TableRenderer = {
             span.dataset.matchType = annotation.match_type;
             span.dataset.panel = panel;
 
-            container.appendChild(span);
+            fragment.appendChild(span);
         });
+
+        container.appendChild(fragment);
     },
 
     toggleRowExpansion(index) {
@@ -45,6 +45,44 @@
         return { passed: passedTests, failed: failedTests, success: failedTests === 0 };
     }
 
+// Reference Wagner-Fischer DP, kept as an oracle for the bit-parallel
+// implementations under test
+function referenceLevenshtein(str1, str2) {
+    const m = str1.length;
+    const n = str2.length;
+    let prevRow = Array.from({ length: n + 1 }, (_, j) => j);
+    let currRow = new Array(n + 1);
+
+    for (let i = 1; i <= m; i++) {
+        currRow[0] = i;
+        for (let j = 1; j <= n; j++) {
+            currRow[j] = str1[i - 1] === str2[j - 1]
+                ? prevRow[j - 1]
+                : 1 + Math.min(prevRow[j], currRow[j - 1], prevRow[j - 1]);
+        }
+        [prevRow, currRow] = [currRow, prevRow];
+    }
+
+    return prevRow[n];
+}
+
+// Small seeded PRNG so the randomized cases are reproducible
+function makeRandom(seed) {
+    let state = seed;
+    return function() {
+        state = (state * 1103515245 + 12345) & 0x7fffffff;
+        return state / 0x7fffffff;
+    };
+}
+
+function randomString(random, length, alphabet) {
+    let s = '';
+    for (let i = 0; i < length; i++) {
+        s += alphabet[Math.floor(random() * alphabet.length)];
+    }
+    return s;
+}
+
 // Levenshtein Distance Tests
 
 test('Levenshtein: identical strings', () => {
@@ -72,6 +110,165 @@ test('Levenshtein: multiple edits', () => {
     assertEquals(levenshteinDistance('saturday', 'sunday'), 3, 'saturday->sunday should be 3 edits');
 });
 
+test('Levenshtein: matches reference DP on random word-length strings', () => {
+    // Exercises the single-block (<= 32 char) bit-parallel path
+    const random = makeRandom(42);
+    for (let i = 0; i < 200; i++) {
+        const a = randomString(random, Math.floor(random() * 33), 'abcde');
+        const b = randomString(random, Math.floor(random() * 33), 'abcde');
+        assertEquals(levenshteinDistance(a, b), referenceLevenshtein(a, b),
+                     `Distance mismatch for "${a}" vs "${b}"`);
+    }
+});
+
+test('Levenshtein: matches reference DP across block boundaries', () => {
+    // Exercises the multi-block path, with lengths straddling the 32-bit
+    // block edges where carry propagation bugs would show up
+    const random = makeRandom(7);
+    const lengths = [31, 32, 33, 63, 64, 65, 95, 96, 97];
+    for (const la of lengths) {
+        for (const lb of lengths) {
+            const a = randomString(random, la, 'abc');
+            const b = randomString(random, lb, 'abc');
+            assertEquals(levenshteinDistance(a, b), referenceLevenshtein(a, b),
+                         `Distance mismatch at lengths ${la} x ${lb}`);
+        }
+    }
+});
+
+test('Levenshtein: common affixes do not change the distance', () => {
+    // The implementation strips shared prefixes/suffixes before running
+    // the kernels; the answers must be identical to the unstripped DP
+    assertEquals(levenshteinDistance('abcXYZdef', 'abcPQRdef'), 3,
+                 'Only the differing middle should count');
+    assertEquals(levenshteinDistance('prefix-kitten', 'prefix-sitting'), 3,
+                 'Shared prefix should not change kitten->sitting');
+    assertEquals(levenshteinDistance('kitten-suffix', 'sitting-suffix'), 3,
+                 'Shared suffix should not change kitten->sitting');
+    assertEquals(levenshteinDistance('abcdef', 'abcxdef'), 1,
+                 'Prefix and suffix overlap around one insertion');
+
+    const random = makeRandom(99);
+    for (let i = 0; i < 100; i++) {
+        const affix = randomString(random, Math.floor(random() * 40), 'abc');
+        const a = affix + randomString(random, Math.floor(random() * 10), 'xyz') + affix;
+        const b = affix + randomString(random, Math.floor(random() * 10), 'xyz') + affix;
+        assertEquals(levenshteinDistance(a, b), referenceLevenshtein(a, b),
+                     `Affixed distance mismatch for "${a}" vs "${b}"`);
+    }
+});
+
+test('Levenshtein: document-sized strings', () => {
+    // The CER path runs over whole concatenated documents, not words;
+    // make sure the long-string path agrees with the oracle there too
+    const random = makeRandom(1234);
+    const base = randomString(random, 1200, 'abcdefghij ');
+
+    // Corrupt scattered positions, OCR-style
+    const chars = base.split('');
+    for (let i = 50; i < chars.length; i += 97) {
+        chars[i] = chars[i] === 'x' ? 'y' : 'x';
+    }
+    const corrupted = chars.join('');
+
+    assertEquals(levenshteinDistance(base, corrupted), referenceLevenshtein(base, corrupted),
+                 'Long-string distance should match reference DP');
+    assertTrue(levenshteinDistance(base, corrupted) > 0,
+               'Corrupted copy should have nonzero distance');
+});
+
+test('Levenshtein: equal-length near-identical strings', () => {
+    // Single substitutions anywhere in an otherwise identical pair are the
+    // dominant OCR error shape; after affix stripping they resolve without
+    // running a kernel, and must still agree with the full DP
+    const random = makeRandom(55);
+    for (let i = 0; i < 50; i++) {
+        const len = 2 + Math.floor(random() * 60);
+        const chars = randomString(random, len, 'abcdef').split('');
+        const pos = Math.floor(random() * len);
+        const original = chars.join('');
+        chars[pos] = chars[pos] === 'z' ? 'y' : 'z';
+        const mutated = chars.join('');
+
+        assertEquals(levenshteinDistance(original, mutated), 1,
+                     `Single substitution at ${pos} in length ${len} should be 1`);
+        assertEquals(levenshteinDistance(original, mutated),
+                     referenceLevenshtein(original, mutated),
+                     'Fast path must agree with reference DP');
+    }
+});
+
+test('Levenshtein: non-ASCII code units', () => {
+    // Distances are over UTF-16 code units, matching how the rest of the
+    // pipeline measures characters. Code points above the ASCII fast path
+    // go through the Map fallback in the Peq tables.
+    assertEquals(levenshteinDistance('caf\u00e9', 'cafe\u0301'), 2,
+                 'Precomposed vs combining form differs by 2 code units');
+    assertEquals(levenshteinDistance('漢字テスト', '漢宇テスト'), 1,
+                 'One CJK substitution should be 1');
+    // Emoji are surrogate pairs: equal pairs match as two units, and a
+    // same-high-surrogate emoji swap touches only the low surrogate
+    assertEquals(levenshteinDistance('\u{1F600}abc', '\u{1F600}abd'), 1,
+                 'Equal emoji prefix should not add distance');
+    assertEquals(levenshteinDistance('\u{1F600}', '\u{1F601}'), 1,
+                 'Adjacent emoji differ in one code unit');
+});
+
+test('Levenshtein: identical large strings short-circuit', () => {
+    // A same-contents comparison should return 0 via the equality check /
+    // affix stripping, never by filling DP state for a megabyte of text.
+    // No timing assertion (too flaky for CI); if the short-circuit
+    // regressed, this test would show up as a suite-time cliff.
+    const big = 'the quick brown fox '.repeat(50000); // ~1 MB
+    assertEquals(levenshteinDistance(big, big), 0,
+                 'Identical large strings should have distance 0');
+    assertEquals(levenshteinDistance(big, big + '!'), 1,
+                 'A single trailing edit on a large string should be 1');
+});
+
+test('Levenshtein: distance is symmetric', () => {
+    // The implementation swaps so the shorter string drives the pattern;
+    // that must never change the answer
+    assertEquals(levenshteinDistance('kitten', 'sitting'),
+                 levenshteinDistance('sitting', 'kitten'),
+                 'Fixed pair should be symmetric');
+
+    const random = makeRandom(2024);
+    for (let i = 0; i < 100; i++) {
+        const a = randomString(random, Math.floor(random() * 80), 'abcd');
+        const b = randomString(random, Math.floor(random() * 80), 'abcd');
+        assertEquals(levenshteinDistance(a, b), levenshteinDistance(b, a),
+                     `Symmetry violated for "${a}" vs "${b}"`);
+    }
+});
+
+// OSA Distance Tests
+
+test('OSA: adjacent transposition counts as one edit', () => {
+    assertEquals(osaDistance('ca', 'ac'), 1, 'Swapped pair should be 1');
+    assertEquals(osaDistance('abcd', 'acbd'), 1, 'Inner swap should be 1');
+    assertEquals(osaDistance('from', 'form'), 1, 'Classic OCR confusion should be 1');
+    // Plain Levenshtein charges the same swap as two edits
+    assertEquals(levenshteinDistance('ca', 'ac'), 2, 'Levenshtein counts a swap as 2');
+});
+
+test('OSA: agrees with Levenshtein when no transpositions apply', () => {
+    assertEquals(osaDistance('hello', 'hello'), 0, 'Identical strings should be 0');
+    assertEquals(osaDistance('hello', ''), 5, 'Empty side should cost full length');
+    assertEquals(osaDistance('kitten', 'sitting'), 3, 'kitten->sitting should stay 3');
+    assertEquals(osaDistance('quick', 'quiok'), 1, 'Single substitution should stay 1');
+});
+
+test('OSA: never exceeds Levenshtein', () => {
+    const random = makeRandom(321);
+    for (let i = 0; i < 100; i++) {
+        const a = randomString(random, Math.floor(random() * 15), 'abc');
+        const b = randomString(random, Math.floor(random() * 15), 'abc');
+        assertTrue(osaDistance(a, b) <= levenshteinDistance(a, b),
+                   `OSA should be <= Levenshtein for "${a}" vs "${b}"`);
+    }
+});
+
 // Metrics Tests
 
 test('Metrics: perfect match', () => {
@@ -283,6 +480,24 @@ test('Metrics: CRR with word arrays provided', () => {
     assertEquals(metrics.avg_crr, 0.875, 'CRR should be 0.875 with word arrays');
 });
 
+test('Metrics: CRR clamps at zero when errors exceed GT length', () => {
+    // OCR hallucinated far more text than the ground truth contains:
+    // distance("ab", "zzzzzzzzzz") = 10 against only 2 GT chars, so the raw
+    // 1 - CER would be -4.0; the reported rate floors at 0
+    const matches = [
+        ['ab', null, null, 'gt_only'],
+        [null, 'zzzzzzzzzz', null, 'ocr_only']
+    ];
+
+    const metrics = calculateMetrics(matches);
+    assertEquals(metrics.avg_crr, 0.0, 'CRR should clamp to 0, not go negative');
+    assertEquals(metrics.char_errors, 10, 'Raw error count should stay exact');
+
+    // Same behavior on the primary path with word arrays provided
+    const metrics2 = calculateMetrics(matches, ['ab'], ['zzzzzzzzzz']);
+    assertEquals(metrics2.avg_crr, 0.0, 'Word-array path should clamp too');
+});
+
     // Register with test registry
     if (typeof window !== 'undefined' && window.TestRegistry) {
         window.TestRegistry.register('Metrics', { run: runTests });
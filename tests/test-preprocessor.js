@@ -45,6 +45,11 @@
         return { passed: passedTests, failed: failedTests, success: failedTests === 0 };
     }
 
+// Shared configs, built once per suite run instead of once per test
+const CONFIG_DEFAULT = { case_sensitive: false, ignore_punctuation: true };
+const CONFIG_KEEP_PUNCT = { case_sensitive: false, ignore_punctuation: false };
+const CONFIG_CASE_SENSITIVE = { case_sensitive: true, ignore_punctuation: false };
+
 // Tests
 
 test('Tokenize: simple text', () => {
@@ -68,32 +73,27 @@ test('Tokenize: empty string', () => {
 });
 
 test('Normalize: lowercase', () => {
-    const config = { case_sensitive: false, ignore_punctuation: false };
-    const result = normalize(['Hello', 'WORLD'], config);
+    const result = normalize(['Hello', 'WORLD'], CONFIG_KEEP_PUNCT);
     assertEquals(result, ['hello', 'world'], 'Should convert to lowercase');
 });
 
 test('Normalize: case sensitive', () => {
-    const config = { case_sensitive: true, ignore_punctuation: false };
-    const result = normalize(['Hello', 'WORLD'], config);
+    const result = normalize(['Hello', 'WORLD'], CONFIG_CASE_SENSITIVE);
     assertEquals(result, ['Hello', 'WORLD'], 'Should preserve case');
 });
 
 test('Normalize: remove punctuation', () => {
-    const config = { case_sensitive: false, ignore_punctuation: true };
-    const result = normalize(['hello,', 'world!'], config);
+    const result = normalize(['hello,', 'world!'], CONFIG_DEFAULT);
     assertEquals(result, ['hello', 'world'], 'Should remove punctuation');
 });
 
 test('Normalize: keep punctuation', () => {
-    const config = { case_sensitive: false, ignore_punctuation: false };
-    const result = normalize(['hello,', 'world!'], config);
+    const result = normalize(['hello,', 'world!'], CONFIG_KEEP_PUNCT);
     assertEquals(result, ['hello,', 'world!'], 'Should keep punctuation');
 });
 
 test('PreprocessText: full pipeline', () => {
-    const config = { case_sensitive: false, ignore_punctuation: true };
-    const result = preprocessText('Hello, World!', config);
+    const result = preprocessText('Hello, World!', CONFIG_DEFAULT);
 
     assertEquals(result.words, ['hello', 'world'], 'Words should be normalized');
     assertTrue(result.wordData.length === 2, 'Should have 2 word data entries');
@@ -102,8 +102,7 @@ test('PreprocessText: full pipeline', () => {
 });
 
 test('PreprocessText: empty after normalization', () => {
-    const config = { case_sensitive: false, ignore_punctuation: true };
-    const result = preprocessText('... !!!', config);
+    const result = preprocessText('... !!!', CONFIG_DEFAULT);
 
     assertEquals(result.words, [], 'Should have no words after removing punctuation');
     assertEquals(result.wordData, [], 'Should have no word data');
@@ -111,8 +110,7 @@ test('PreprocessText: empty after normalization', () => {
 
 test('PreprocessText: invoice example', () => {
     const text = 'Invoice Number: INV-2024-001';
-    const config = { case_sensitive: false, ignore_punctuation: true };
-    const result = preprocessText(text, config);
+    const result = preprocessText(text, CONFIG_DEFAULT);
 
     assertEquals(result.words, ['invoice', 'number', 'inv', '2024', '001'],
                  'Should handle invoice text correctly');